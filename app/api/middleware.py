@@ -1,5 +1,6 @@
 import json
-from fnmatch import fnmatch
+import re
+from fnmatch import translate
 
 import inflection
 from django.conf import settings
@@ -40,6 +41,11 @@ def adjust_urls_for_script_name(urls):
 
 apply_case_conversion_views = adjust_urls_for_script_name(apply_case_conversion_views)
 
+# Match the paths against all the patterns at once with a precompiled regex
+apply_case_conversion_re = re.compile(
+    "|".join(translate(pattern) for pattern in apply_case_conversion_views)
+)
+
 
 def camel_to_snake(data):
     """
@@ -77,13 +83,11 @@ class CaseConversionMiddleware(MiddlewareMixin):
         None
     Methods:
         process_request(request): Applies case conversion to the request data.
-        process_response(request, response): Applies case conversion to the response data.
+        process_template_response(request, response): Applies case conversion to the response data before it is rendered.
     """
 
     def process_request(self, request):
-        if any(
-            fnmatch(request.path, pattern) for pattern in apply_case_conversion_views
-        ):
+        if apply_case_conversion_re.match(request.path):
             # Handle GET parameters
             if request.method == "GET":
                 query_params = request.GET.copy()  # Create a mutable copy
@@ -139,21 +143,11 @@ class CaseConversionMiddleware(MiddlewareMixin):
 
         return None
 
-    def process_response(self, request, response):
-        if any(
-            fnmatch(request.path, pattern) for pattern in apply_case_conversion_views
-        ):
+    def process_template_response(self, request, response):
+        # Convert the data before the handler renders the response, so the
+        # response body is only rendered once
+        if apply_case_conversion_re.match(request.path):
             if hasattr(response, "data"):
-                try:
-                    # Parse the response content manually
-                    data = response.data
-                    camel_case_data = snake_to_camel(data)
-                    # Convert the JSON data back to bytes
-                    response.data = camel_case_data
-                    response._is_rendered = False
-                    response.render()
-
-                except (ValueError, json.JSONDecodeError):
-                    pass
+                response.data = snake_to_camel(response.data)
 
         return response
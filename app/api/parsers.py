@@ -0,0 +1,27 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSON parser using orjson, which is several times faster than the
+    standard library json module.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parse the incoming JSON stream.
+        Args:
+            stream: The request body stream.
+            media_type (str): The media type of the request.
+            parser_context (dict): The parser context.
+        Returns:
+            The parsed data.
+        Raises:
+            ParseError: If the request body is not valid JSON.
+        """
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -5,6 +5,7 @@ from app.models import Genre, Review, Title, ValidationToken
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
 # Get the user model
@@ -60,6 +61,16 @@ class UserSerializer(serializers.ModelSerializer):
                 "required": False,
             },  # Password required only for create
             "token": {"write_only": True, "required": False},
+            # Emails are unique regardless of case
+            "email": {
+                "validators": [
+                    UniqueValidator(
+                        queryset=User.objects.all(),
+                        lookup="iexact",
+                        message="user with this email already exists.",
+                    )
+                ]
+            },
         }
 
     def validate(self, data):
@@ -219,10 +230,10 @@ class ValidationSerializer(serializers.Serializer):
         if not email:
             raise serializers.ValidationError("No email provided.")
         if type == "register":
-            if User.objects.filter(email=email).exists():
+            if User.objects.filter(email__iexact=email).exists():
                 raise serializers.ValidationError("Email already exists.")
         elif type == "reset_password":
-            if not User.objects.filter(email=email).exists():
+            if not User.objects.filter(email__iexact=email).exists():
                 raise serializers.ValidationError("Email not found.")
         return data
 
@@ -0,0 +1,140 @@
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from app.models import Genre
+from django.core.cache import cache
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# TMDB API key
+TMDB_API_KEY = os.getenv("TMDB_API_KEY")
+API_HEADERS = {
+    "accept": "application/json",
+    "Authorization": f"Bearer {TMDB_API_KEY}",
+}
+
+# TMDB API URLs
+URL_MOVIE_GENRES = "https://api.themoviedb.org/3/genre/movie/list?language=en"
+URL_TV_GENRES = "https://api.themoviedb.org/3/genre/tv/list?language=en"
+URL_SEARCH = "https://api.themoviedb.org/3/search/{movie_or_tv}"
+
+# TMDB HTTP session with bounded timeouts and retries on transient errors
+TMDB_TIMEOUT = (3, 10)  # (connect, read) in seconds
+tmdb_session = requests.Session()
+tmdb_session.headers.update(API_HEADERS)
+tmdb_session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=["GET"],
+        )
+    ),
+)
+
+# Genres rarely change, so they are synced at most once per day
+GENRES_SYNCED_CACHE_KEY = "tmdb_genres_synced"
+GENRES_SYNC_INTERVAL = 60 * 60 * 24
+
+# Search results are cached for an hour so repeated searches skip TMDB
+SEARCH_CACHE_TIMEOUT = 60 * 60
+
+
+def fetch_genres(url):
+    """
+    Fetch a list of genres from the TMDB API.
+    Args:
+        url (str): The TMDB genre list URL.
+    Returns:
+        list: The genres as dictionaries with "id" and "name" keys.
+    Raises:
+        requests.RequestException: If the request to TMDB fails.
+    """
+    response = tmdb_session.get(url, timeout=TMDB_TIMEOUT)
+    response.raise_for_status()
+    return response.json()["genres"]
+
+
+def search_titles(movie_or_tv, search_term):
+    """
+    Search TMDB for movies or TV shows, caching the results.
+    Args:
+        movie_or_tv (str): The type of titles to search, "movie" or "tv".
+        search_term (str): The search term.
+    Returns:
+        list: The search results as returned by TMDB.
+    Raises:
+        requests.RequestException: If the request to TMDB fails.
+    """
+    # Hash the search term, cache keys must not contain spaces
+    digest = hashlib.md5(f"{movie_or_tv}:{search_term}".encode()).hexdigest()
+    cache_key = f"tmdb_search:{digest}"
+
+    results = cache.get(cache_key)
+    if results is None:
+        # Let requests encode the query, search terms may contain "&" or "#"
+        response = tmdb_session.get(
+            URL_SEARCH.format(movie_or_tv=movie_or_tv),
+            params={
+                "query": search_term,
+                "include_adult": "false",
+                "language": "en-US",
+                "page": 1,
+            },
+            timeout=TMDB_TIMEOUT,
+        )
+        response.raise_for_status()
+        results = response.json()["results"]
+        cache.set(cache_key, results, SEARCH_CACHE_TIMEOUT)
+    return results
+
+
+def sync_genres():
+    """
+    Fetch movie and TV genres from the TMDB API and populate the Genre table.
+    Returns:
+        int: The number of genres synced.
+    Raises:
+        requests.RequestException: If there is an error fetching genres from TMDB API.
+    """
+    # Fetch both genre lists concurrently, TMDB latency dominates the sync
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        movie_genres, tv_genres = executor.map(
+            fetch_genres, (URL_MOVIE_GENRES, URL_TV_GENRES)
+        )
+    genres = movie_genres + tv_genres
+
+    # Populate or create Genre instances in a single transaction
+    with transaction.atomic():
+        for genre in genres:
+            Genre.objects.update_or_create(
+                id=genre["id"], defaults={"genre_name": genre["name"]}
+            )
+
+    return len(genres)
+
+
+def sync_genres_if_stale():
+    """
+    Sync the genres unless they were already synced within the sync interval.
+    A failed sync is logged and skipped so the genres already stored in the
+    database keep being served; the next call retries it.
+    """
+    # cache.add only succeeds when the key is missing, i.e. the last sync expired
+    if cache.add(GENRES_SYNCED_CACHE_KEY, True, GENRES_SYNC_INTERVAL):
+        try:
+            sync_genres()
+        except requests.RequestException as e:
+            cache.delete(GENRES_SYNCED_CACHE_KEY)
+            logger.warning("TMDB genre sync failed: %s", e)
+        except Exception:
+            cache.delete(GENRES_SYNCED_CACHE_KEY)
+            raise
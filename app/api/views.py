@@ -1,7 +1,6 @@
-import os
+import logging
 import uuid
 
-import requests
 from app.models import Genre, Review, Title, ValidationToken
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -42,17 +41,9 @@ from .serializers import (
     UserSerializer,
     ValidationSerializer,
 )
+from .tmdb import search_titles, sync_genres_if_stale
 
-# TMDB API key
-TMDB_API_KEY = os.getenv("TMDB_API_KEY")
-API_HEADERS = {
-    "accept": "application/json",
-    "Authorization": f"Bearer {TMDB_API_KEY}",
-}
-
-# TMDB API URLs
-URL_MOVIE_GENRES = "https://api.themoviedb.org/3/genre/movie/list?language=en"
-URL_TV_GENRES = "https://api.themoviedb.org/3/genre/tv/list?language=en"
+logger = logging.getLogger(__name__)
 
 # Set the User model
 User = get_user_model()
@@ -63,27 +54,18 @@ User = get_user_model()
 @permission_classes([IsAdminUser])
 def get_tmdb_search(request):
     """
-    Fetches movie and TV genres from TMDB API and performs a search based on the provided search term.
+    Performs a TMDB search based on the provided search term.
+    Movie and TV genres are synced from TMDB API if they have not been synced recently.
     Args:
         request (HttpRequest): The HTTP request object.
     Returns:
         Response: The HTTP response object containing the search results.
     Raises:
-        requests.RequestException: If there is an error fetching genres from TMDB API.
         Exception: If there is an error handling the search request.
     """
-    # Fetching movie and TV genres from TMDB API
     try:
-        movie_genres = requests.get(URL_MOVIE_GENRES, headers=API_HEADERS).json()[
-            "genres"
-        ]
-        tv_genres = requests.get(URL_TV_GENRES, headers=API_HEADERS).json()["genres"]
-
-        # Populate or create Genre instances
-        for genre in movie_genres + tv_genres:
-            Genre.objects.update_or_create(
-                id=genre["id"], defaults={"genre_name": genre["name"]}
-            )
+        # Make sure the TMDB genres exist locally (synced at most once per day)
+        sync_genres_if_stale()
 
         # Performing search based on the provided search term and movie or TV
 
@@ -100,13 +82,12 @@ def get_tmdb_search(request):
                 {"error": "No movie or tv provided"}, status=status.HTTP_400_BAD_REQUEST
             )
         else:
-            # Perform search
-            url = f"https://api.themoviedb.org/3/search/{movie_or_tv}?query={search_term}&include_adult=false&language=en-US&page=1"
-            response = requests.get(url, headers=API_HEADERS)
-            response.raise_for_status()
-            return Response(response.json()["results"], status=status.HTTP_200_OK)
-    except Exception as e:
+            # Perform search, repeated searches are served from the cache
+            results = search_titles(movie_or_tv, search_term)
+            return Response(results, status=status.HTTP_200_OK)
+    except Exception:
         # Handle exceptions
+        logger.exception("TMDB search failed")
         return Response(
             {"error": "An error occurred during the TMDB search."},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -177,7 +158,8 @@ class TitleViewSet(BaseViewSet):
     """
 
     # Set attributes
-    queryset = Title.objects.all()
+    # Prefetch the related ids the serializer lists to avoid a query per title
+    queryset = Title.objects.prefetch_related("genres", "reviews")
     serializer_class = TitlesSerializer
     filterset_class = TitleFilter
     # set default ordering
@@ -222,7 +204,8 @@ class ReviewViewSet(BaseViewSet):
     """
 
     # Set attributes
-    queryset = Review.objects.all()
+    # Load the authors with the reviews, the serializer reads their names
+    queryset = Review.objects.select_related("author")
     serializer_class = ReviewsSerializer
     filterset_class = ReviewFilter
     # set default ordering
@@ -520,7 +503,7 @@ class PasswordResetViewSet(viewsets.ViewSet):
         new_password = serializer.validated_data["new_password"]
 
         # Retrieve user and update the password
-        user = User.objects.get(email=email)
+        user = User.objects.get(email__iexact=email)
         user.set_password(new_password)
         user.save()
 
@@ -586,8 +569,9 @@ class AuthViewSet(viewsets.ViewSet):
         first_name = idinfo.get("given_name", "")
         last_name = idinfo.get("family_name", "")
         user, _ = User.objects.get_or_create(
-            email=email,
+            email__iexact=email,
             defaults={
+                "email": email,
                 "username": email.split("@")[0],
                 "first_name": first_name,
                 "last_name": last_name,
@@ -632,11 +616,11 @@ class CustomTokenObtainPairView(TokenObtainPairView):
         Raises:
         - AuthenticationFailed: If the account is locked due to multiple failed login attempts.
         """
-        user = User.objects.filter(email=request.data.get("email")).first()
+        user = User.objects.filter(email__iexact=request.data.get("email")).first()
 
         if user:
             # Check if the account is locked
-            if user.is_locked and user.lock_until and user.lock_until > timezone.now():
+            if user.is_locked:
                 raise AuthenticationFailed(
                     "Your account has been locked due to multiple failed login attempts."
                 )
@@ -668,19 +652,9 @@ class CustomTokenObtainPairView(TokenObtainPairView):
         """
         if isinstance(exc, AuthenticationFailed):
             email = self.request.data.get("email")
-            user = User.objects.filter(email=email).first()
-
-            if user:
-                # Increment failed attempts if login failed
-                user.failed_login_attempts += 1
-                remaining_attempts = (
-                    settings.MAX_FAILED_LOGIN_ATTEMPTS - user.failed_login_attempts
-                )
-                if remaining_attempts == 0:
-                    user.lock_account()
-                if user.is_locked:
-                    exc.detail = "Your account has been locked due to multiple failed login attempts."
+            user = User.objects.filter(email__iexact=email).first()
 
-                user.save()
+            if user and user.register_failed_and_maybe_lock():
+                exc.detail = "Your account has been locked due to multiple failed login attempts."
 
         return super().handle_exception(exc)
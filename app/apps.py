@@ -1,5 +1,7 @@
 from django.apps import AppConfig
 
-class AppConfig(AppConfig):
+
+class MainAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+    label = "app"
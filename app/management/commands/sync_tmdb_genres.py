@@ -0,0 +1,30 @@
+import requests
+from app.api.tmdb import GENRES_SYNC_INTERVAL, GENRES_SYNCED_CACHE_KEY, sync_genres
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Management command that syncs the movie and TV genres from the TMDB API.
+
+    Usage:
+        python manage.py sync_tmdb_genres
+
+    Intended to be run from a scheduler (e.g. a daily cron job) or a post-deploy hook
+    so the genre sync stays off the request path.
+    """
+
+    help = "Sync the movie and TV genres from the TMDB API."
+
+    def handle(self, *args, **options):
+        try:
+            count = sync_genres()
+        except requests.RequestException as e:
+            raise CommandError(f"Error fetching genres from TMDB: {e}")
+
+        # Mark the genres as fresh so requests don't sync them again, the mark
+        # is shared with the web workers through the cache
+        cache.set(GENRES_SYNCED_CACHE_KEY, True, GENRES_SYNC_INTERVAL)
+
+        self.stdout.write(self.style.SUCCESS(f"Synced {count} genres from TMDB."))
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Avg
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
@@ -40,13 +41,20 @@ class Title(models.Model):
     def __str__(self):
         return self.title
 
+    @classmethod
+    def recompute_rating(cls, title_id):
+        # Aggregate the average rating in the database and write it back
+        # without loading the title row
+        avg_rating = Review.objects.filter(title_id=title_id).aggregate(
+            avg=Avg("rating")
+        )["avg"]
+        rating = round(avg_rating or 0.0, 1)
+        cls.objects.filter(pk=title_id).update(rating=rating)
+        return rating
+
     def update_average_rating(self):
         # Calculate the average rating for the title
-        total_ratings = sum(review.rating for review in self.reviews.all())
-        num_reviews = self.reviews.count()
-        avg_rating = total_ratings / num_reviews if num_reviews > 0 else 0.0
-        self.rating = round(avg_rating, 1)
-        self.save()
+        self.rating = Title.recompute_rating(self.pk)
 
 
 # Reviews model with relationships to Users and Titles
@@ -86,14 +94,14 @@ class ValidationToken(models.Model):
 # Listen for the post_save event to update average ratings
 @receiver(post_save, sender=Review)
 def update_average_rating_on_review_save(sender, instance, **kwargs):
-    if instance.title:
+    if instance.title_id:
         # Update the average rating for the corresponding Title
-        instance.title.update_average_rating()
+        Title.recompute_rating(instance.title_id)
 
 
 # Listen for the post_delete event to update average ratings
 @receiver(post_delete, sender=Review)
 def update_average_rating_on_review_delete(sender, instance, **kwargs):
-    if instance.title:
+    if instance.title_id:
         # Update the average rating for the corresponding Title
-        instance.title.update_average_rating()
+        Title.recompute_rating(instance.title_id)
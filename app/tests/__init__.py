@@ -0,0 +1,15 @@
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+@receiver(connection_created)
+def speed_up_sqlite_test_connection(sender, connection, **kwargs):
+    """
+    Skip fsyncs and keep the journal and temporary tables in memory on the
+    SQLite test database; durability does not matter for throwaway test data.
+    """
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA temp_store=MEMORY")
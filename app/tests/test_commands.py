@@ -0,0 +1,77 @@
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import requests
+from app.api.tmdb import GENRES_SYNCED_CACHE_KEY, URL_MOVIE_GENRES, URL_TV_GENRES
+from app.models import Genre
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+
+class SyncTmdbGenresCommandTest(TestCase):
+    """
+    Test the sync_tmdb_genres management command.
+
+    This class defines the test suite for the sync_tmdb_genres command.
+    - Test if the genres are created and renamed from the TMDB response.
+    - Test if a TMDB error is reported as a CommandError.
+    """
+
+    def setUp(self):
+        """
+        Clear the cache so the genres are not marked as synced by another test.
+        """
+        cache.clear()
+
+    def mock_response(self, genres):
+        """
+        Build a mocked TMDB response returning the given genres.
+        """
+        response = MagicMock()
+        response.json.return_value = {"genres": genres}
+        return response
+
+    @patch("app.api.tmdb.tmdb_session.get")
+    def test_sync_genres(self, mock_get):
+        """
+        Test if the genres are created and renamed from the TMDB response.
+
+        The movie and TV genre lists share the "Animation" genre, and an
+        existing genre with the same id is renamed.
+        """
+        Genre.objects.create(id=28, genre_name="Old Action")
+        # The two lists are fetched concurrently, so respond by URL
+        responses = {
+            URL_MOVIE_GENRES: self.mock_response(
+                [{"id": 28, "name": "Action"}, {"id": 16, "name": "Animation"}]
+            ),
+            URL_TV_GENRES: self.mock_response(
+                [{"id": 16, "name": "Animation"}, {"id": 18, "name": "Drama"}]
+            ),
+        }
+        mock_get.side_effect = lambda url, **kwargs: responses[url]
+
+        out = StringIO()
+        call_command("sync_tmdb_genres", stdout=out)
+
+        self.assertEqual(
+            dict(Genre.objects.values_list("id", "genre_name")),
+            {28: "Action", 16: "Animation", 18: "Drama"},
+        )
+        self.assertIn("Synced 4 genres from TMDB.", out.getvalue())
+        # The genres are marked as fresh so requests don't sync them again
+        self.assertTrue(cache.get(GENRES_SYNCED_CACHE_KEY))
+
+    @patch("app.api.tmdb.tmdb_session.get")
+    def test_sync_genres_tmdb_error(self, mock_get):
+        """
+        Test if a TMDB error is reported as a CommandError.
+        """
+        mock_get.side_effect = requests.ConnectionError("TMDB is down")
+
+        with self.assertRaises(CommandError):
+            call_command("sync_tmdb_genres", stdout=StringIO())
+        self.assertFalse(Genre.objects.exists())
+        self.assertIsNone(cache.get(GENRES_SYNCED_CACHE_KEY))
@@ -1,8 +1,12 @@
-from datetime import date
+from datetime import date, timedelta
 
 from app.models import Genre, Review, Title
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import IntegrityError
+from django.db.models.signals import post_save, pre_save
 from django.test import TestCase
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -188,6 +192,18 @@ class TitleAverageRatingTest(TestCase):
         self.title.refresh_from_db()
         self.assertEqual(self.title.rating, 4.0)  # Only review1 remains, rating is 4.0
 
+    def test_recompute_rating_without_reviews(self):
+        """
+        Test if the rating is reset when the last review is removed.
+
+        This test case deletes both reviews and checks that recompute_rating
+        returns 0.0 and stores it on the title.
+        """
+        Review.objects.filter(title=self.title).delete()
+        self.assertEqual(Title.recompute_rating(self.title.id), 0.0)
+        self.title.refresh_from_db()
+        self.assertEqual(self.title.rating, 0.0)
+
 
 class GenreModelTest(TestCase):
     """
@@ -232,7 +248,20 @@ class UserModelTest(TestCase):
 
     This class defines the test suite for the User model.
     - Test if the user is created successfully.
+    - Test if the email is unique and looked up regardless of case.
+    - Test if the failed login attempts cannot be negative.
+    - Test if users are loaded with their permissions in fixed queries.
     - Test if the __str__ method of User model is correct.
+    - Test if concurrent failed attempts are all counted.
+    - Test if a failed attempt locks the account at the threshold.
+    - Test if failed attempts are not counted while the account is locked.
+    - Test if a failed attempt after an expired lock locks the account again.
+    - Test if locking the account only updates the lock fields.
+    - Test if resetting the failed attempts unlocks the account.
+    - Test if resetting already reset failed attempts skips the database.
+    - Test if only the accounts with an expired lock are unlocked.
+    - Test if the failed login and lock methods do not send save signals.
+    - Test if the account is only locked until its lock expires.
     """
 
     def setUp(self):
@@ -272,6 +301,52 @@ class UserModelTest(TestCase):
                 password="password456",
             )
 
+    def test_email_is_unique_regardless_of_case(self):
+        """
+        Test that email uniqueness ignores the case of the email.
+        """
+        with self.assertRaises(IntegrityError):
+            User.objects.create_user(
+                email="TestUser@example.com",
+                username="anotheruser",
+                password="password456",
+            )
+
+    def test_failed_login_attempts_cannot_be_negative(self):
+        """
+        Test that the database rejects a negative failed login attempts count.
+        """
+        with self.assertRaises(IntegrityError):
+            User.objects.filter(pk=self.user.pk).update(failed_login_attempts=-1)
+
+    def test_get_by_natural_key_ignores_case(self):
+        """
+        Test that users are looked up by email regardless of case on login.
+        """
+        self.assertEqual(
+            User.objects.get_by_natural_key("TESTUSER@EXAMPLE.COM"), self.user
+        )
+
+    def test_with_auth_related(self):
+        """
+        Test that users are loaded with their groups and permissions in a
+        fixed number of queries.
+        """
+        group = Group.objects.create(name="editors")
+        group.permissions.set(Permission.objects.all()[:2])
+        self.user.groups.add(group)
+        self.user.user_permissions.set(Permission.objects.all()[2:4])
+
+        # Users, groups, group permissions and user permissions
+        with self.assertNumQueries(4):
+            user = User.objects.with_auth_related().get(pk=self.user.pk)
+            group_permissions = [
+                p for g in user.groups.all() for p in g.permissions.all()
+            ]
+            user_permissions = list(user.user_permissions.all())
+        self.assertEqual(len(group_permissions), 2)
+        self.assertEqual(len(user_permissions), 2)
+
     def test_login_with_email(self):
         """
         Test if login can be done using the email field.
@@ -318,3 +393,157 @@ class UserModelTest(TestCase):
         returns the email of the user.
         """
         self.assertEqual(str(self.user), self.user.email)
+
+    def test_register_failed_concurrently(self):
+        """
+        Test if concurrent failed attempts are all counted.
+
+        This test case registers a failed attempt on a stale instance and
+        checks that it is added to the count stored in the database rather
+        than overwriting it.
+        """
+        stale_user = User.objects.get(pk=self.user.pk)
+        self.user.register_failed_and_maybe_lock()
+        stale_user.register_failed_and_maybe_lock()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.failed_login_attempts, 2)
+
+    def test_register_failed_and_maybe_lock(self):
+        """
+        Test if a failed attempt locks the account at the threshold.
+
+        This test case registers failed attempts with a threshold of two and
+        checks that each one is a single UPDATE, and that only the second one
+        locks the account.
+        """
+        with self.assertNumQueries(1):
+            self.assertFalse(self.user.register_failed_and_maybe_lock(threshold=2))
+        with self.assertNumQueries(1):
+            self.assertTrue(self.user.register_failed_and_maybe_lock(threshold=2))
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.failed_login_attempts, 2)
+        self.assertTrue(self.user.is_locked)
+
+    def test_register_failed_while_locked(self):
+        """
+        Test if failed attempts are not counted while the account is locked.
+        """
+        self.user.lock_account()
+        with self.assertNumQueries(0):
+            self.assertTrue(self.user.register_failed_and_maybe_lock())
+        self.assertEqual(self.user.failed_login_attempts, 0)
+
+    def test_register_failed_after_lock_expires(self):
+        """
+        Test if a failed attempt after an expired lock locks the account again.
+
+        This test case starts with the failed attempts at the threshold and an
+        expired lock, and checks that the next failed attempt locks the account
+        again instead of only incrementing the count.
+        """
+        User.objects.filter(pk=self.user.pk).update(
+            failed_login_attempts=2, lock_until=timezone.now() - timedelta(minutes=1)
+        )
+        self.user.refresh_from_db()
+
+        self.assertTrue(self.user.register_failed_and_maybe_lock(threshold=2))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.failed_login_attempts, 3)
+        self.assertTrue(self.user.is_locked)
+
+    def test_lock_account(self):
+        """
+        Test if locking the account only updates the lock fields.
+
+        This test case locks the user and checks that the lock is stored with
+        a single UPDATE, and that a pending change to another field is not
+        written along with it.
+        """
+        self.user.username = "unsaved"
+        with self.assertNumQueries(1):
+            self.user.lock_account()
+        # The instance is kept in sync with the stored lock
+        self.assertTrue(self.user.is_locked)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_locked)
+        self.assertGreater(self.user.lock_until, timezone.now())
+        self.assertEqual(self.user.username, "testuser")
+
+    def test_reset_failed_attempts(self):
+        """
+        Test if resetting the failed attempts unlocks the account.
+        """
+        self.user.failed_login_attempts = 5
+        self.user.save()
+        self.user.lock_account()
+
+        self.user.reset_failed_attempts()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.failed_login_attempts, 0)
+        self.assertFalse(self.user.is_locked)
+        self.assertIsNone(self.user.lock_until)
+
+    def test_reset_failed_attempts_already_reset(self):
+        """
+        Test if resetting already reset failed attempts skips the database.
+        """
+        with self.assertNumQueries(0):
+            self.user.reset_failed_attempts()
+
+    def test_lock_methods_skip_save_signals(self):
+        """
+        Test if the failed login and lock methods do not send save signals.
+        """
+        sent = []
+
+        def receiver(**kwargs):
+            sent.append(kwargs["signal"])
+
+        for signal in (pre_save, post_save):
+            signal.connect(receiver, sender=User)
+            self.addCleanup(signal.disconnect, receiver, sender=User)
+
+        self.user.register_failed_and_maybe_lock()
+        self.user.lock_account()
+        self.user.reset_failed_attempts()
+        self.assertEqual(sent, [])
+
+    def test_unlock_expired(self):
+        """
+        Test if only the accounts with an expired lock are unlocked.
+
+        This test case locks one user until a past date and another until a
+        future date, and checks that a single UPDATE unlocks only the first.
+        """
+        other_user = User.objects.create_user(
+            email="otheruser@example.com", username="otheruser", password="password123"
+        )
+        User.objects.filter(pk=self.user.pk).update(
+            lock_until=timezone.now() - timedelta(minutes=1),
+            failed_login_attempts=5,
+        )
+        other_user.lock_account()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(User.unlock_expired(), 1)
+
+        self.user.refresh_from_db()
+        other_user.refresh_from_db()
+        self.assertFalse(self.user.is_locked)
+        self.assertIsNone(self.user.lock_until)
+        self.assertEqual(self.user.failed_login_attempts, 0)
+        self.assertTrue(other_user.is_locked)
+
+    def test_is_locked(self):
+        """
+        Test if the account is only locked until its lock expires.
+        """
+        self.assertFalse(self.user.is_locked)
+        self.user.lock_until = timezone.now() + timedelta(minutes=1)
+        self.assertTrue(self.user.is_locked)
+        self.user.lock_until = timezone.now() - timedelta(minutes=1)
+        self.assertFalse(self.user.is_locked)
@@ -0,0 +1,172 @@
+import io
+from decimal import Decimal
+from unittest.mock import patch
+
+from app.api.parsers import ORJSONParser
+from app.api.renderers import ORJSONRenderer
+from app.api.views import GenreViewSet
+from app.models import Genre
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+User = get_user_model()
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    """
+    Test the orjson renderer.
+
+    This class defines the test suite for the ORJSONRenderer.
+    - Test if the data is rendered as JSON bytes.
+    - Test if the types orjson does not support fall back to the DRF encoder.
+    - Test if non-string dict keys are rendered like the DRF JSON renderer.
+    - Test if the data is indented when an indent is requested.
+    - Test if the line and paragraph separators are escaped.
+    - Test if no data is rendered as an empty body.
+    """
+
+    def test_render(self):
+        """
+        Test if the data is rendered as JSON bytes.
+        """
+        data = {"id": 1, "title": "Test Movie", "genres": [28, 12]}
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"id":1,"title":"Test Movie","genres":[28,12]}',
+        )
+
+    def test_render_fallback_types(self):
+        """
+        Test if the types orjson does not support fall back to the DRF encoder,
+        rendering them like the DRF JSON renderer does.
+        """
+        data = {"rating": Decimal("4.5"), "error": gettext_lazy("Not found.")}
+        self.assertEqual(
+            ORJSONRenderer().render(data), b'{"rating":4.5,"error":"Not found."}'
+        )
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_non_str_keys(self):
+        """
+        Test if non-string dict keys are rendered like the DRF JSON renderer.
+        """
+        data = {1: "one", 2.5: "two and a half", False: "no", None: "none"}
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"1":"one","2.5":"two and a half","false":"no","null":"none"}',
+        )
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_indent(self):
+        """
+        Test if the data is indented by two spaces when an indent is requested
+        in the accepted media type or the renderer context.
+        """
+        data = {"id": 1, "genres": [28]}
+        expected = b'{\n  "id": 1,\n  "genres": [\n    28\n  ]\n}'
+        self.assertEqual(
+            ORJSONRenderer().render(data, "application/json; indent=4"), expected
+        )
+        self.assertEqual(
+            ORJSONRenderer().render(data, renderer_context={"indent": 4}), expected
+        )
+
+    def test_render_line_separators(self):
+        """
+        Test if the line and paragraph separators are escaped like the DRF JSON
+        renderer does.
+        """
+        data = {"overview": "First\u2028Second\u2029Third"}
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"overview":"First\\u2028Second\\u2029Third"}',
+        )
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_none(self):
+        """
+        Test if no data is rendered as an empty body.
+        """
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class ORJSONParserTest(SimpleTestCase):
+    """
+    Test the orjson parser.
+
+    This class defines the test suite for the ORJSONParser.
+    - Test if a JSON body is parsed.
+    - Test if an invalid JSON body raises a ParseError.
+    """
+
+    def test_parse(self):
+        """
+        Test if a JSON body is parsed.
+        """
+        stream = io.BytesIO(b'{"email": "testuser@example.com", "rating": 4.5}')
+        self.assertEqual(
+            ORJSONParser().parse(stream),
+            {"email": "testuser@example.com", "rating": 4.5},
+        )
+
+    def test_parse_error(self):
+        """
+        Test if an invalid JSON body raises a ParseError.
+        """
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"email": '))
+
+
+class ORJSONViewTest(APITestCase):
+    """
+    Test a view using the orjson renderer and parser, as in production.
+
+    This class defines the test suite for a view using the ORJSONRenderer and
+    ORJSONParser.
+    - Test if a camelCase request body is parsed and the response is rendered
+      with camelCase keys.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_user(
+            email="adminuser@example.com",
+            password="password123",
+            username="adminuser",
+            is_staff=True,
+        )
+
+    def setUp(self):
+        # The views read their renderer and parser classes from the settings
+        # when they are defined, so override_settings would not reach them
+        for name, classes in (
+            ("renderer_classes", [ORJSONRenderer]),
+            ("parser_classes", [ORJSONParser]),
+        ):
+            patcher = patch.object(GenreViewSet, name, classes)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client.force_authenticate(user=self.admin_user)
+
+    def test_create_and_retrieve(self):
+        """
+        Test if a camelCase request body is parsed and the response is rendered
+        with camelCase keys.
+        """
+        response = self.client.post(reverse("genre-list"), {"genreName": "Action"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        genre = Genre.objects.get(genre_name="Action")
+
+        response = self.client.get(reverse("genre-detail", kwargs={"pk": genre.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(
+            response.content, f'{{"id":{genre.pk},"genreName":"Action"}}'.encode()
+        )
@@ -1,3 +1,5 @@
+import sys
+
 from .settings import *
 
 DEBUG = True
@@ -11,3 +13,13 @@ DATABASES = {
 
 # Use console backend to avoid sending real emails
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+
+# Use a fast password hasher and JSON test client request bodies when running
+# the tests against the dev settings, interactive dev logins keep the default
+# hasher
+if "test" in sys.argv:
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    REST_FRAMEWORK = {
+        **REST_FRAMEWORK,
+        "TEST_REQUEST_DEFAULT_FORMAT": "json",
+    }
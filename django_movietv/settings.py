@@ -29,7 +29,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",  # Django sessions
     "django.contrib.messages",  # Django messages framework
     "django.contrib.staticfiles",  # Django static files
-    "app.apps.AppConfig",  # Your app
+    "app.apps.MainAppConfig",  # Your app
     "users.apps.UsersConfig",  # Users app
     "rest_framework",  # Django REST framework
     "rest_framework_simplejwt.token_blacklist",  # JWT token blacklist
@@ -42,7 +42,6 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # Django CORS middleware
     "django.middleware.common.CommonMiddleware",  # Django common middleware
     "django.contrib.sessions.middleware.SessionMiddleware",  # Django sessions middleware
-    "django.middleware.common.CommonMiddleware",  # Django common middleware
     "django.middleware.csrf.CsrfViewMiddleware",  # Django CSRF middleware
     "django.contrib.auth.middleware.AuthenticationMiddleware",  # Django authentication middleware
     "django.contrib.messages.middleware.MessageMiddleware",  # Django messages middleware
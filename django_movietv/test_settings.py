@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 from .settings import *
 
 DEBUG = True
@@ -10,12 +12,47 @@ DATABASES = {
     }
 }
 
-# Use console backend to avoid sending real emails
-EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+# Use a fast password hasher, the default one is deliberately slow
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Keep sent emails in memory (mail.outbox) instead of sending them
+EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
-# Disable caching during tests
+# Use a real in-memory cache so cached code paths are exercised, tests that
+# rely on the cache contents clear it first
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.dummy.DummyCache",
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "test",
     }
 }
+
+# Encode test client request bodies as JSON, like the frontend does
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "TEST_REQUEST_DEFAULT_FORMAT": "json",
+}
+
+# Access tokens are generated once per test run and reused across test
+# classes, so they must outlive the whole suite
+SIMPLE_JWT = {
+    **SIMPLE_JWT,
+    "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
+}
+
+
+class DisableMigrations:
+    """
+    Build the test database straight from the models instead of applying
+    every migration. Missing migrations are caught by
+    `python manage.py makemigrations --check` instead.
+    """
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-15 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0004_customuser_failed_login_attempts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(fields=["lock_until"], name="user_lock_until_idx"),
+        ),
+    ]
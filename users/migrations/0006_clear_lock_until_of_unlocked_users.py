@@ -0,0 +1,25 @@
+# Generated by Django 5.0.3 on 2026-10-15 22:53
+
+from django.db import migrations
+
+
+def clear_lock_until_of_unlocked_users(apps, schema_editor):
+    # is_locked is about to be derived from lock_until, so a lock_until left
+    # on an unlocked account must not lock it again
+    CustomUser = apps.get_model("users", "CustomUser")
+    CustomUser.objects.filter(is_locked=False).exclude(lock_until=None).update(
+        lock_until=None
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0005_customuser_user_lock_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            clear_lock_until_of_unlocked_users, migrations.RunPython.noop
+        ),
+    ]
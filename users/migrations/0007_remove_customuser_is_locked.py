@@ -0,0 +1,18 @@
+# Generated by Django 5.0.3 on 2026-10-15 22:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0006_clear_lock_until_of_unlocked_users"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="customuser",
+            name="is_locked",
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.0.3 on 2026-10-15 22:54
+
+import django.db.models.functions.text
+import users.models
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Upper
+
+
+def check_no_duplicate_emails_regardless_of_case(apps, schema_editor):
+    # Emails that only differ by case would make the constraint fail with a
+    # bare IntegrityError, name them so they can be merged first
+    CustomUser = apps.get_model("users", "CustomUser")
+    duplicates = (
+        CustomUser.objects.values(upper_email=Upper("email"))
+        .annotate(count=Count("id"))
+        .filter(count__gt=1)
+        .values("upper_email")
+    )
+    emails = list(
+        CustomUser.objects.annotate(upper_email=Upper("email"))
+        .filter(upper_email__in=duplicates)
+        .order_by("upper_email", "email")
+        .values_list("email", flat=True)
+    )
+    if emails:
+        raise RuntimeError(
+            "Cannot make the user emails unique regardless of case, these "
+            f"emails only differ by case: {', '.join(emails)}. Merge or rename "
+            "those users and run the migration again."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0007_remove_customuser_is_locked"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="customuser",
+            managers=[
+                ("objects", users.models.CustomUserManager()),
+            ],
+        ),
+        migrations.RunPython(
+            check_no_duplicate_emails_regardless_of_case, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="customuser",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Upper("email"),
+                name="user_email_upper_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.0.3 on 2026-10-15 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0008_customuser_email_upper_unique"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="customuser",
+            name="failed_login_attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name="customuser",
+            constraint=models.CheckConstraint(
+                check=models.Q(("failed_login_attempts__gte", 0)),
+                name="user_failed_login_attempts_gte_0",
+            ),
+        ),
+    ]
@@ -1,28 +1,134 @@
 from datetime import timedelta
 
-from django.contrib.auth.models import AbstractUser
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 # Create your models here.
 
+# How long an account stays locked after too many failed login attempts
+LOCK_DURATION = timedelta(minutes=30)
+
+
+class CustomUserManager(UserManager):
+    """
+    User manager that looks users up by email regardless of case on login,
+    and loads users with their permissions up front.
+    """
+
+    def get_by_natural_key(self, username):
+        # Served by the case-insensitive unique constraint on the email
+        return self.get(**{f"{self.model.USERNAME_FIELD}__iexact": username})
+
+    def with_auth_related(self):
+        """
+        Users with their groups, group permissions and user permissions
+        prefetched, in three extra queries however many users are loaded.
+        """
+        return self.get_queryset().prefetch_related(
+            "groups__permissions", "user_permissions"
+        )
+
 
 class CustomUser(AbstractUser):
     email = models.EmailField(max_length=100, unique=True)
-    failed_login_attempts = models.IntegerField(default=0)
-    is_locked = models.BooleanField(default=False)
+    failed_login_attempts = models.PositiveSmallIntegerField(default=0)
+    # The account is locked until this date, None when it is not locked
     lock_until = models.DateTimeField(null=True, blank=True)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
+    objects = CustomUserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Lets unlock_expired find the expired locks without a table scan
+            models.Index(fields=["lock_until"], name="user_lock_until_idx"),
+        ]
+        constraints = [
+            # Emails are unique regardless of case, its index also serves the
+            # case-insensitive email lookups
+            models.UniqueConstraint(Upper("email"), name="user_email_upper_unique"),
+            # PositiveSmallIntegerField already has the same CHECK on SQLite and
+            # PostgreSQL, this named one keeps it whatever the column type
+            models.CheckConstraint(
+                check=models.Q(failed_login_attempts__gte=0),
+                name="user_failed_login_attempts_gte_0",
+            ),
+        ]
+
+    @classmethod
+    def unlock_expired(cls):
+        """
+        Unlock all the accounts whose lock has expired with a single UPDATE.
+        Returns:
+            int: The number of unlocked accounts.
+        """
+        return cls.objects.filter(lock_until__lte=timezone.now()).update(
+            lock_until=None, failed_login_attempts=0
+        )
+
+    @property
+    def is_locked(self):
+        """
+        Whether the account is locked, i.e. its lock has not expired yet.
+        """
+        return self.lock_until is not None and self.lock_until > timezone.now()
+
+    # The failed login and lock methods below write with QuerySet.update()
+    # rather than save() on purpose: they run on every login, only touch the
+    # login counter and lock columns, and must not fire the pre_save and
+    # post_save signals. Keep them that way.
+
+    def register_failed_and_maybe_lock(self, threshold=None):
+        """
+        Record a failed login attempt and lock the account once the attempts
+        reach the threshold, in a single UPDATE. The account is locked again
+        on the first failed attempt after an expired lock. Attempts made while
+        the account is locked are not counted.
+        Args:
+            threshold (int): The number of failed attempts that locks the
+                account, settings.MAX_FAILED_LOGIN_ATTEMPTS by default.
+        Returns:
+            bool: Whether the account is locked.
+        """
+        if self.is_locked:
+            return True
+        if threshold is None:
+            threshold = settings.MAX_FAILED_LOGIN_ATTEMPTS
+
+        lock_until = timezone.now() + LOCK_DURATION
+        type(self).objects.filter(pk=self.pk).update(
+            failed_login_attempts=models.F("failed_login_attempts") + 1,
+            lock_until=models.Case(
+                models.When(
+                    failed_login_attempts__gte=threshold - 1,
+                    then=models.Value(lock_until),
+                ),
+                default=models.F("lock_until"),
+            ),
+        )
+
+        # Mirror the update on the instance instead of reloading it
+        self.failed_login_attempts += 1
+        if self.failed_login_attempts >= threshold:
+            self.lock_until = lock_until
+        return self.is_locked
+
     def lock_account(self):
-        self.is_locked = True
-        self.lock_until = timezone.now() + timedelta(minutes=30)  # Lock for 30 minutes
-        self.save()
+        self.lock_until = timezone.now() + LOCK_DURATION
+        type(self).objects.filter(pk=self.pk).update(lock_until=self.lock_until)
 
     def reset_failed_attempts(self):
+        # Nothing to write on the usual successful login
+        if not self.failed_login_attempts and self.lock_until is None:
+            return
         self.failed_login_attempts = 0
-        self.is_locked = False
         self.lock_until = None
-        self.save()
+        type(self).objects.filter(pk=self.pk).update(
+            failed_login_attempts=self.failed_login_attempts,
+            lock_until=self.lock_until,
+        )